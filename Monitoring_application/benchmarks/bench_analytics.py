@@ -0,0 +1,82 @@
+"""Time /analytics on a synthetic 7-day history sampled every 5 s (the target is well under 100 ms).
+
+Run from Monitoring_application: python -m benchmarks.bench_analytics
+"""
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+import numpy as np
+
+from code import analytics_utils
+
+SAMPLE_INTERVAL_SECONDS = 5
+DAYS = 7  # /analytics clamps days to DATA_RETENTION_DAYS
+BUCKET_MINUTES = 5
+NEW_SAMPLES = 20
+TARGET_MS = 100
+
+def build_db(path, days=DAYS):
+    n = days * 86400 // SAMPLE_INTERVAL_SECONDS
+    rng = np.random.default_rng(0)
+    start = datetime.now() - timedelta(days=days)
+    timestamps = np.datetime_as_string(
+        np.datetime64(start, 'us') + np.arange(n) * np.timedelta64(SAMPLE_INTERVAL_SECONDS, 's'))
+    io = np.cumsum(rng.integers(0, 50 * 1024 * 1024, size=(2, n)), axis=1)
+    rows = zip(timestamps.tolist(), np.round(rng.random(n) * 100, 1).tolist(),
+               np.round(40 + rng.random(n) * 20, 1).tolist(), np.round(np.linspace(50, 80, n), 1).tolist(),
+               io[0].tolist(), io[1].tolist())
+    conn = sqlite3.connect(path)
+    conn.execute('''CREATE TABLE resource_usage (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        cpu_percent REAL,
+        memory_percent REAL,
+        disk_percent REAL,
+        disk_read_bytes INTEGER DEFAULT 0,
+        disk_write_bytes INTEGER DEFAULT 0
+    )''')
+    conn.executemany('''INSERT INTO resource_usage (timestamp, cpu_percent, memory_percent, disk_percent, disk_read_bytes, disk_write_bytes)
+                        VALUES (?, ?, ?, ?, ?, ?)''', rows)
+    conn.commit()
+    conn.close()
+    return n
+
+def add_sample(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''INSERT INTO resource_usage (timestamp, cpu_percent, memory_percent, disk_percent, disk_read_bytes, disk_write_bytes)
+                    SELECT ?, 50, 50, disk_percent, disk_read_bytes + 1024, disk_write_bytes + 1024
+                    FROM resource_usage ORDER BY id DESC LIMIT 1''', (datetime.now().isoformat(),))
+    conn.commit()
+    conn.close()
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        analytics_utils.DB_PATH = os.path.join(tmp, 'resource_data.db')
+        n = build_db(analytics_utils.DB_PATH)
+        print(f"{n} rows ({DAYS} days at {SAMPLE_INTERVAL_SECONDS}s), {BUCKET_MINUTES}-minute buckets\n")
+
+        run = lambda: analytics_utils.get_analytics(DAYS, BUCKET_MINUTES)
+        cold = timed(run)
+        hit = min(timed(run) for _ in range(NEW_SAMPLES))
+        recompute = []
+        for _ in range(NEW_SAMPLES):
+            add_sample(analytics_utils.DB_PATH)
+            recompute.append(timed(run))
+
+        print(f"{'call':<28}{'ms':>10}")
+        print(f"{'cold (initial load)':<28}{cold:>10.1f}")
+        print(f"{'cache hit (best)':<28}{hit:>10.2f}")
+        print(f"{'new sample (median)':<28}{np.median(recompute):>10.1f}")
+        print(f"{'new sample (max)':<28}{max(recompute):>10.1f}")
+        verdict = "met" if np.median(recompute) < TARGET_MS else "missed"
+        print(f"\n{TARGET_MS} ms target for steady-state calls: {verdict}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare encoders, /history layouts and compression on a synthetic 7-day history.
+
+Run from Monitoring_application: python -m benchmarks.bench_serialization
+"""
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+import orjson
+
+from code.db_utils import history_to_columns
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from fastapi.encoders import jsonable_encoder
+except ImportError:
+    jsonable_encoder = None
+
+SAMPLE_INTERVAL_SECONDS = 5
+DAYS = 7
+REPEAT = 5
+GZIP_LEVELS = (1, 5, 9)  # 5 is what main.py uses; 9 is Starlette's default
+
+def make_history(days=DAYS):
+    n = days * 86400 // SAMPLE_INTERVAL_SECONDS
+    start = datetime.now() - timedelta(days=days)
+    return [{
+        "timestamp": (start + timedelta(seconds=i * SAMPLE_INTERVAL_SECONDS)).isoformat(),
+        "cpu_percent": float(i % 100) / 1.7,
+        "memory_percent": 40.0 + (i % 37) / 3,
+        "disk_percent": 55.3,
+        "disk_io_mb_sec": round((i % 13) * 0.17, 2),
+    } for i in range(n)]
+
+def best_time(fn):
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    rows = make_history()
+    columns = history_to_columns(rows)
+    print(f"{len(rows)} rows ({DAYS} days at {SAMPLE_INTERVAL_SECONDS}s)\n")
+
+    encoders = [
+        ("json rows", lambda: json.dumps(rows).encode()),
+        ("orjson rows", lambda: orjson.dumps(rows)),
+        ("orjson columnar", lambda: orjson.dumps(history_to_columns(rows))),
+    ]
+    if jsonable_encoder:
+        encoders.insert(0, ("jsonable_encoder+json rows", lambda: json.dumps(jsonable_encoder(rows)).encode()))
+
+    print(f"{'encoder':<28}{'cpu ms':>10}")
+    for name, fn in encoders:
+        print(f"{name:<28}{best_time(fn):>10.1f}")
+
+    # Compression runs on every response too, so report its CPU time next to the bytes saved
+    compressors = [(f"gzip-{level}", lambda body, level=level: gzip.compress(body, compresslevel=level))
+                   for level in GZIP_LEVELS]
+    if brotli:
+        compressors.append(("br-4", lambda body: brotli.compress(body, quality=4)))
+
+    print(f"\n{'payload':<28}{'KB':>10}{'cpu ms':>10}")
+    for name, body in (("rows", orjson.dumps(rows)), ("columnar", orjson.dumps(columns))):
+        print(f"{name + ' raw':<28}{len(body) / 1024:>10.1f}{'-':>10}")
+        for label, compress in compressors:
+            size = len(compress(body))
+            print(f"{name + ' ' + label:<28}{size / 1024:>10.1f}{best_time(lambda: compress(body)):>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+import numpy as np
+
+DB_PATH = 'resource_data.db'
+PERCENTILES = (50, 95, 99)
+BYTES_PER_MB = 1024 * 1024
+EPOCH = datetime(1970, 1, 1)
+COLUMNS = ("seconds", "cpu_percent", "memory_percent", "disk_percent", "disk_io_bytes")
+
+# Columnar copy of resource_usage sorted by time; after the first load only rows with id > last_id
+# are fetched, and rows older than the widest window loaded so far are trimmed on every refresh
+_history_store = {"last_id": 0, "days": 0, "columns": None}
+_store_lock = threading.Lock()
+
+# Cached results keyed by (days, bucket_minutes); entries are reused until a new sample arrives
+_analytics_cache = {}
+_cache_lock = threading.Lock()
+
+def get_latest_sample_id():
+    conn = sqlite3.connect(DB_PATH)
+    c = conn.cursor()
+    c.execute('''SELECT MAX(id) FROM resource_usage''')
+    latest = c.fetchone()[0]
+    conn.close()
+    return latest or 0
+
+def _fetch_columns(where, params):
+    """Run one query and return (max id, 2D float array in COLUMNS order); rows with NULL metrics are dropped."""
+    conn = sqlite3.connect(DB_PATH)
+    c = conn.cursor()
+    # julianday() parses the ISO timestamps inside SQLite, so Python never builds datetime objects
+    c.execute(f'''
+        SELECT id, (julianday(timestamp) - 2440587.5) * 86400.0, cpu_percent, memory_percent, disk_percent,
+               disk_read_bytes + disk_write_bytes
+        FROM resource_usage
+        WHERE {where}
+        ORDER BY timestamp ASC
+    ''', params)
+    rows = np.array(c.fetchall(), dtype=np.float64).reshape(-1, len(COLUMNS) + 1)
+    conn.close()
+    last_id = int(rows[:, 0].max()) if len(rows) else 0
+    rows = rows[np.isfinite(rows).all(axis=1)]
+    return last_id, rows[:, 1:]
+
+def _since_seconds(days):
+    return (datetime.now() - timedelta(days=days) - EPOCH).total_seconds()
+
+def load_history_arrays(days=7):
+    """Return a dict of NumPy columns for the window, refreshing the store incrementally."""
+    with _store_lock:
+        store = _history_store
+        if store["columns"] is None or days > store["days"]:
+            last_id, columns = _fetch_columns('timestamp >= ?', ((datetime.now() - timedelta(days=days)).isoformat(),))
+            store.update({"days": days, "columns": columns})
+        else:
+            last_id, columns = _fetch_columns('id > ?', (store["last_id"],))
+            if len(columns):
+                merged = np.concatenate((store["columns"], columns))
+                # Timestamps are naive local times and can step back (NTP, DST), so keep the store sorted
+                if np.any(np.diff(merged[len(store["columns"]) - 1:, 0]) < 0):
+                    merged = merged[np.argsort(merged[:, 0], kind='stable')]
+                store["columns"] = merged
+        store["last_id"] = max(store["last_id"], last_id)
+        columns = store["columns"]
+        columns = store["columns"] = columns[np.searchsorted(columns[:, 0], _since_seconds(store["days"])):]
+
+    columns = columns[np.searchsorted(columns[:, 0], _since_seconds(days)):]
+    if not len(columns):
+        return None
+    return dict(zip(COLUMNS, columns.T))
+
+def _to_datetime(seconds):
+    return (np.asarray(seconds) * 1e6).astype('datetime64[us]').astype('datetime64[s]')
+
+def disk_io_rates(seconds, io_bytes):
+    """MB/s between consecutive samples; counter resets and clock skew yield 0 like get_history."""
+    rates = np.zeros(len(io_bytes))
+    if len(io_bytes) < 2:
+        return rates
+    time_diff = np.diff(seconds)
+    byte_diff = np.diff(io_bytes)
+    valid = (time_diff > 0) & (byte_diff >= 0)
+    rates[1:][valid] = (byte_diff[valid] / BYTES_PER_MB) / time_diff[valid]
+    return rates
+
+def percentile_summary(values):
+    p = np.percentile(values, PERCENTILES)
+    summary = {f"p{q}": round(float(v), 2) for q, v in zip(PERCENTILES, p)}
+    summary["avg"] = round(float(values.mean()), 2)
+    summary["max"] = round(float(values.max()), 2)
+    return summary
+
+def bucket_means(bucket_index, values, n_buckets):
+    """Mean of values per time bucket; empty buckets come back as NaN."""
+    sums = np.bincount(bucket_index, weights=values, minlength=n_buckets)
+    counts = np.bincount(bucket_index, minlength=n_buckets)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+def moving_average(values, window):
+    """Trailing moving average that skips NaN buckets."""
+    valid = ~np.isnan(values)
+    kernel = np.ones(window)
+    sums = np.convolve(np.where(valid, values, 0.0), kernel)[:len(values)]
+    counts = np.convolve(valid.astype(np.float64), kernel)[:len(values)]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+def forecast_disk_full(seconds, disk):
+    """Least-squares fit of disk_percent over time and the projected time it reaches 100%."""
+    forecast = {"slope_percent_per_day": None, "eta_hours": None, "full_at": None}
+    if len(disk) < 2 or np.ptp(seconds) == 0:
+        return forecast
+    # Fit relative to the first sample to keep the epoch offset out of the regression
+    offset = seconds - seconds[0]
+    slope, intercept = np.polyfit(offset, disk, 1)
+    forecast["slope_percent_per_day"] = round(float(slope * 86400), 4)
+    if slope <= 0:
+        return forecast
+    full_offset = (100.0 - intercept) / slope
+    forecast["eta_hours"] = round(float(max(0.0, full_offset - offset[-1]) / 3600), 2)
+    forecast["full_at"] = str(_to_datetime(seconds[0] + full_offset))
+    return forecast
+
+def _to_list(values):
+    result = np.round(values, 2).tolist()
+    for i in np.flatnonzero(np.isnan(values)):
+        result[i] = None
+    return result
+
+def compute_analytics(data, days=7, bucket_minutes=5, moving_window=12):
+    if data is None:
+        return {"days": days, "bucket_minutes": bucket_minutes, "samples": 0}
+
+    seconds = data["seconds"]
+    metrics = {
+        "cpu_percent": data["cpu_percent"],
+        "memory_percent": data["memory_percent"],
+        "disk_percent": data["disk_percent"],
+        "disk_io_mb_sec": disk_io_rates(seconds, data["disk_io_bytes"]),
+    }
+
+    # Resample onto fixed time buckets so moving averages are evenly spaced; rows are sorted by time
+    bucket_seconds = bucket_minutes * 60
+    bucket_index = ((seconds - seconds[0]) // bucket_seconds).astype(np.int64)
+    n_buckets = int(bucket_index[-1]) + 1
+    bucket_starts = _to_datetime(seconds[0] + np.arange(n_buckets) * bucket_seconds)
+
+    trends = {"timestamp": np.datetime_as_string(bucket_starts).tolist()}
+    for name, values in metrics.items():
+        trends[name] = _to_list(moving_average(bucket_means(bucket_index, values, n_buckets), moving_window))
+
+    return {
+        "days": days,
+        "bucket_minutes": bucket_minutes,
+        "samples": len(seconds),
+        "from": str(_to_datetime(seconds[0])),
+        "to": str(_to_datetime(seconds[-1])),
+        "percentiles": {name: percentile_summary(values) for name, values in metrics.items()},
+        "moving_average": trends,
+        "disk_forecast": forecast_disk_full(seconds, data["disk_percent"]),
+    }
+
+def get_analytics(days=7, bucket_minutes=5):
+    """Analytics for the window; recomputed only once a newer sample has been stored."""
+    latest_id = get_latest_sample_id()
+    key = (days, bucket_minutes)
+    with _cache_lock:
+        cached = _analytics_cache.get(key)
+        if cached and cached[0] == latest_id:
+            return cached[1]
+    result = compute_analytics(load_history_arrays(days), days, bucket_minutes)
+    with _cache_lock:
+        for stale in [k for k, v in _analytics_cache.items() if v[0] != latest_id]:
+            del _analytics_cache[stale]
+        _analytics_cache[key] = (latest_id, result)
+    return result
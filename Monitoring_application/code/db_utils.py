@@ -92,6 +92,12 @@ def get_history(days=7):
         print(f"Database error in get_history: {e}")
         return []
 
+HISTORY_FIELDS = ("timestamp", "cpu_percent", "memory_percent", "disk_percent", "disk_io_mb_sec")
+
+def history_to_columns(history):
+    """Convert get_history() rows into a compact {field: [values...]} layout."""
+    return {field: [row[field] for row in history] for field in HISTORY_FIELDS}
+
 def get_averages():
     conn = sqlite3.connect(DB_PATH)
     c = conn.cursor()
@@ -1,4 +1,10 @@
 let historyData = [];
+// Server uptime and the local monotonic time it was read at; rendered into the page and
+// refreshed by fetchStatus(), so the browser clock never has to agree with the server's
+let uptimeBase = {
+    seconds: parseInt(document.getElementById('uptime').dataset.uptimeSeconds, 10),
+    at: performance.now()
+};
 
 // Format date to "DDth Month YYYY"
 function formatDate(date) {
@@ -39,6 +45,7 @@ async function fetchStatus() {
         updateResourceColors('cpu', data.cpu_percent);
         updateResourceColors('mem', data.memory_percent);
         updateResourceColors('disk', data.disk_percent);
+        uptimeBase = { seconds: data.uptime_seconds, at: performance.now() };
     } catch (err) {
         showError('Failed to update status');
     }
@@ -150,16 +157,13 @@ function showError(message) {
     }, 5000);
 }
 
-// Update system uptime
+// Count the server's uptime forward locally, formatted as HH:MM:SS like /status
 function updateUptime() {
-    fetch('/status')
-        .then(response => response.json())
-        .then(data => {
-            if (data.uptime) {
-                document.getElementById('uptime').textContent = data.uptime;
-            }
-        })
-        .catch(err => console.error('Failed to update uptime:', err));
+    if (isNaN(uptimeBase.seconds)) return;
+    const seconds = uptimeBase.seconds + Math.floor((performance.now() - uptimeBase.at) / 1000);
+    const pad = n => String(n).padStart(2, '0');
+    document.getElementById('uptime').textContent =
+        `${pad(Math.floor(seconds / 3600) % 24)}:${pad(Math.floor(seconds / 60) % 60)}:${pad(seconds % 60)}`;
 }
 
 // Initialize
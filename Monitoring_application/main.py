@@ -1,14 +1,14 @@
-from fastapi import FastAPI, Depends, Request, BackgroundTasks
+from fastapi import FastAPI, Depends, Request, BackgroundTasks, HTTPException
 from fastapi.security import HTTPBasic
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import psutil
 import sqlite3
 from datetime import datetime, timedelta
-from typing import List
 import os
 import time
 import threading
@@ -21,12 +21,18 @@ import io
 from matplotlib import pyplot as plt
 import uvicorn
 
-from code.db_utils import store_resource_usage, should_store_new_entry, get_history
+try:
+    from brotli_asgi import BrotliMiddleware  # Optional: serves br, falls back to gzip
+except ImportError:
+    BrotliMiddleware = None
+
+from code.db_utils import store_resource_usage, should_store_new_entry, get_history, history_to_columns
 from code.alert_utils import send_alert_email
 from code.auth_utils import authenticate
+from code.analytics_utils import get_analytics
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -37,6 +43,16 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Compress responses larger than COMPRESS_MIN_BYTES when the client accepts it
+COMPRESS_MIN_BYTES = 1024
+# Starlette defaults to level 9, which takes ~5x longer than level 5 on the 7-day /history body
+# for ~12% smaller output; compression runs on the event loop, so favour speed
+GZIP_COMPRESS_LEVEL = 5
+if BrotliMiddleware:
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES, compresslevel=GZIP_COMPRESS_LEVEL)
+
 security = HTTPBasic()
 
 DB_PATH = 'resource_data.db'
@@ -57,6 +73,7 @@ class StatusResponse(BaseModel):
     memory_percent: float
     disk_percent: float
     uptime: str
+    uptime_seconds: int
 
 @app.get("/status", response_model=StatusResponse)
 def get_status(user: str = Depends(authenticate), background_tasks: BackgroundTasks = None):
@@ -85,7 +102,8 @@ def get_status(user: str = Depends(authenticate), background_tasks: BackgroundTa
         "cpu_percent": cpu,
         "memory_percent": mem,
         "disk_percent": disk,
-        "uptime": uptime_str
+        "uptime": uptime_str,
+        "uptime_seconds": uptime_seconds
     }
 
 # --- Analytics Endpoints ---
@@ -107,6 +125,17 @@ def get_stats(user: str = Depends(authenticate)):
         "avg_disk_percent": avg_disk
     }
 
+@app.get("/analytics")
+def get_analytics_endpoint(user: str = Depends(authenticate), days: int = 7, bucket_minutes: int = 5):
+    try:
+        # Clamp like /history so the analytics store never holds rows cleanup_old_data() removed
+        days = min(max(1, days), DATA_RETENTION_DAYS)
+        # Returned directly so the bucket lists skip jsonable_encoder
+        return ORJSONResponse(get_analytics(days, max(1, bucket_minutes)))
+    except Exception as e:
+        print(f"Analytics endpoint error: {e}")
+        return ORJSONResponse({"days": days, "bucket_minutes": bucket_minutes, "samples": 0})
+
 class DiskIOResponse(BaseModel):
     read_speed: float
     write_speed: float
@@ -182,6 +211,7 @@ def dashboard(request: Request, user: str = Depends(authenticate)):
             "memory_percent": mem,
             "disk_percent": disk,
             "uptime": uptime_str,
+            "uptime_seconds": uptime_seconds,
             "last_reboot_date": last_reboot_date,
             "last_reboot_time": last_reboot_time,
             "history": history_data or [],
@@ -352,17 +382,25 @@ def root():
 
 app.mount("/static", StaticFiles(directory="."), name="static")
 
-@app.get("/history", response_model=List[dict])
-def get_history_endpoint(user: str = Depends(authenticate), days: int = 7):
+# Returns ORJSONResponse directly so rows skip response_model validation and jsonable_encoder.
+# layout=columnar sends one array per field instead of one object per row.
+HISTORY_LAYOUTS = ("rows", "columnar")
+
+@app.get("/history")
+def get_history_endpoint(user: str = Depends(authenticate), days: int = 7, layout: str = "rows"):
+    if layout not in HISTORY_LAYOUTS:
+        raise HTTPException(status_code=400, detail=f"layout must be one of: {', '.join(HISTORY_LAYOUTS)}")
     try:
         days = min(days, DATA_RETENTION_DAYS)
         history_data = get_history(days)
         if not history_data:
             print("No history data returned from db_utils.get_history()")
-        return history_data
+        if layout == "columnar":
+            return ORJSONResponse(history_to_columns(history_data))
+        return ORJSONResponse(history_data)
     except Exception as e:
         print(f"History endpoint error: {e}")
-        return []
+        return ORJSONResponse([])
 
 @app.get("/current_status")
 def test_alert(user: str = Depends(authenticate)):
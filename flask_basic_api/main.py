@@ -1,8 +1,30 @@
 import yaml
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_httpauth import HTTPBasicAuth
 
+# Serialize jsonify() responses with orjson; request parsing stays on the stdlib json module.
+# Values orjson can't encode the same way (e.g. integers over 64 bits) use Flask's default provider.
+class ORJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        # orjson only covers the compact and debug (indent=2) layouts that response() asks for
+        if kwargs not in ({}, {"separators": (",", ":")}, {"indent": 2}):
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_PASSTHROUGH_DATETIME  # Let Flask's default() format dates as HTTP dates
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if "indent" in kwargs:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+Compress(app)  # gzip/brotli based on the client's Accept-Encoding
 auth = HTTPBasicAuth()
 
 # File paths